@@ -16,21 +16,39 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     StaleElementReferenceException, 
-    WebDriverException
+    WebDriverException,
+    InvalidSessionIdException
 )
 import time
 import re
+import asyncio
+import aiohttp
 import random
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.parser import HTMLParser
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # Optional - CSV export falls back to pandas
+    pa = pacsv = None
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from collections import OrderedDict
 import logging
 import os
+import io
+import atexit
+import threading
+import weakref
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parallel Chrome workers for detail extraction (each is a full browser - keep low on Streamlit Cloud)
+DETAIL_WORKERS = 4
+
 # Page Configuration
 st.set_page_config(
     page_title="Lead Generation System",
@@ -48,6 +66,73 @@ if 'error_log' not in st.session_state:
     st.session_state.error_log = []
 if 'extraction_stats' not in st.session_state:
     st.session_state.extraction_stats = {}
+if 'export_filename' not in st.session_state:
+    st.session_state.export_filename = None
+if 'drivers' not in st.session_state:
+    st.session_state.drivers = []
+
+# ============================================
+# PRECOMPILED PATTERNS
+# ============================================
+
+# Bounded repeats (RFC local-part/label limits) keep worst-case matching linear on script/JSON blobs
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9](?:[A-Za-z0-9-]{0,63}\.){1,4}[A-Za-z]{2,24}\b')
+PHONE_RE = re.compile(r'(?<!\w)[\+\d][\d\s\-\(\)\.]{7,24}\b')
+MAILTO_RE = re.compile(r'^mailto:', re.I)
+FAKE_RE = re.compile(
+    r'example\.com|domain\.com|test\.com|sample\.com|yoursite\.com|yourdomain\.com'
+    r'|\bemail\.com\b|\bmail\.com\b|image|sentry|wixpress|placeholder|dummy|fake',
+    re.I
+)
+
+# "current/total" counter in Step 2 progress messages
+_PROGRESS_RE = re.compile(r'(\d+)\s*/\s*(\d+)')
+
+# Characters dropped from keyword/location when building the export filename
+_SANITIZE_RE = re.compile(r'[^\w\s-]+')
+
+# One pass over each href; aliases fold short domains into their platform
+SOCIAL_RE = re.compile(r'(?:^|//|\.)(facebook|fb|instagram|twitter|x|linkedin|youtube)\.com/', re.I)
+SOCIAL_PLATFORM_ALIASES = {'fb': 'facebook', 'x': 'twitter'}
+PLATFORM_DISPLAY = {
+    'facebook': 'Facebook',
+    'instagram': 'Instagram',
+    'twitter': 'Twitter',
+    'linkedin': 'LinkedIn',
+    'youtube': 'YouTube',
+}
+
+# Per-process cache of parsed contact info, keyed by normalized URL
+CONTACT_CACHE_SIZE = 256
+
+@st.cache_resource(show_spinner=False)
+def _get_contact_cache():
+    """LRU of parsed contact info plus its lock - shared by every session's consumer thread"""
+    return OrderedDict(), threading.Lock()
+
+_contact_cache, _contact_cache_lock = _get_contact_cache()
+
+# Response body cap (many business sites are multi-MB SPAs) and page text cap
+MAX_RESPONSE_BYTES = 512 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+MAX_PAGE_TEXT = 200_000
+
+# Tags that never hold contact info
+NON_CONTENT_TAGS = ['script', 'style', 'noscript', 'svg']
+
+# BeautifulSoup fallback only builds the body (text) and anchors - <head> is skipped
+ONLY_LINKS = SoupStrainer(['a', 'body'])
+
+# ============================================
+# HTTP HEADERS
+# ============================================
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+}
 
 # ============================================
 # ERROR LOGGING
@@ -75,54 +160,73 @@ def display_error_log():
                     st.caption(f"   Details: {error['details']}")
 
 # ============================================
-# WEBDRIVER INITIALIZATION (NO CACHING - FIXES SESSION ERROR)
+# WEBDRIVER INITIALIZATION & REUSE
 # ============================================
 
+@st.cache_resource(show_spinner=False)
+def _chromedriver_path():
+    """
+    Streamlit Cloud / Chromium (/usr/bin), Render/Docker (/usr/local/bin), else None for system PATH
+    cache_resource resolves it once per process - the script body itself reruns on every interaction
+    """
+    return next(
+        (path for path in ("/usr/bin/chromedriver", "/usr/local/bin/chromedriver") if os.path.exists(path)),
+        None
+    )
+
+_CHROME_ARGS = (
+    # Essential options for deployment
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920x1080",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-features=VizDisplayCompositor",
+    "--single-process",
+    "--remote-debugging-port=0",  # Free port per instance - parallel workers
+    "--disable-extensions",
+    "--disable-popup-blocking",
+    "--ignore-certificate-errors",
+    # User agent
+    "user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+# Skip images/CSS/fonts - the scraper only reads the DOM
+_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
 def get_chrome_driver():
     """
     Initialize Chrome driver - creates FRESH instance each time
     This prevents 'invalid session id' errors
     """
     options = Options()
-    
-    # Essential options for deployment
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920x1080")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-features=VizDisplayCompositor")
-    options.add_argument("--single-process")
-    options.add_argument("--remote-debugging-port=9222")
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-popup-blocking")
-    options.add_argument("--ignore-certificate-errors")
-    
-    # User agent
-    options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    for arg in _CHROME_ARGS:
+        options.add_argument(arg)
     
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    options.add_experimental_option("prefs", _CHROME_PREFS)
+    
+    # Return from driver.get at DOMContentLoaded; explicit waits cover the rest
+    options.page_load_strategy = 'eager'
     
     try:
-        # Detect environment and use appropriate path
-        if os.path.exists("/usr/bin/chromedriver"):
-            # Streamlit Cloud or Chromium installation
-            service = Service(executable_path="/usr/bin/chromedriver")
-            logger.info("Using chromedriver from /usr/bin/")
-        elif os.path.exists("/usr/local/bin/chromedriver"):
-            # Render/Docker with Chrome
-            service = Service(executable_path="/usr/local/bin/chromedriver")
-            logger.info("Using chromedriver from /usr/local/bin/")
+        chromedriver_path = _chromedriver_path()
+        if chromedriver_path:
+            service = Service(executable_path=chromedriver_path)
+            logger.info(f"Using chromedriver from {chromedriver_path}")
         else:
-            # Fallback to system PATH
             service = Service()
             logger.info("Using chromedriver from system PATH")
         
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(60)
-        driver.implicitly_wait(10)
+        driver.implicitly_wait(0)  # Explicit WebDriverWait only - misses return immediately
         logger.info("✅ Chrome driver initialized successfully")
         return driver
         
@@ -130,77 +234,283 @@ def get_chrome_driver():
         logger.error(f"❌ Failed to initialize Chrome driver: {str(e)}")
         return None
 
+@st.cache_resource(show_spinner=False)
+def _get_live_drivers():
+    """Every running Chrome in the process plus its lock - one atexit hook quits them all"""
+    live_drivers, lock = set(), threading.Lock()
+    
+    def quit_all():
+        with lock:
+            remaining = list(live_drivers)
+        for driver in remaining:
+            quit_driver(driver)
+    
+    atexit.register(quit_all)
+    return live_drivers, lock
+
+_live_drivers, _live_drivers_lock = _get_live_drivers()
+
+def quit_driver(driver):
+    """Quit driver, ignoring already-dead sessions"""
+    with _live_drivers_lock:
+        _live_drivers.discard(driver)
+    try:
+        driver.quit()
+        logger.info("✅ Chrome driver closed successfully")
+    except Exception as e:
+        logger.warning(f"⚠️ Error closing driver: {str(e)}")
+
+def _driver_alive(driver):
+    """Probe a parked driver - dead sessions raise InvalidSessionIdException"""
+    try:
+        driver.current_url
+        return True
+    except (InvalidSessionIdException, WebDriverException):
+        return False
+
+def acquire_driver(driver_pool):
+    """
+    Take a live parked driver from driver_pool (reset between runs), or start a new one
+    Safe to call from worker threads - does not touch session state
+    """
+    while True:
+        try:
+            driver = driver_pool.get_nowait()
+        except queue.Empty:
+            break
+        
+        if _driver_alive(driver):
+            try:
+                # Parked drivers sit on about:blank, where delete_all_cookies() has no domain to clear
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                driver.get('about:blank')
+                return driver
+            except WebDriverException:
+                pass
+        quit_driver(driver)
+    
+    driver = get_chrome_driver()
+    if driver is not None:
+        with _live_drivers_lock:
+            _live_drivers.add(driver)
+    return driver
+
+def park_drivers(drivers):
+    """
+    Keep one live driver (on about:blank, so no Maps page idles in memory) and quit the rest
+    Idle sessions then hold at most one Chrome each instead of one per worker
+    """
+    parked = []
+    for driver in drivers:
+        if not parked and _driver_alive(driver):
+            try:
+                driver.get('about:blank')
+                parked.append(driver)
+                continue
+            except WebDriverException:
+                pass
+        quit_driver(driver)
+    return parked
+
+def reset_drivers():
+    """Quit every Chrome driver parked in session state"""
+    for driver in st.session_state.drivers:
+        quit_driver(driver)
+    st.session_state.drivers = []
+
 # ============================================
 # EMAIL & SOCIAL MEDIA EXTRACTION
 # ============================================
 
-def extract_emails_from_text(text):
-    """Extract email addresses from text"""
-    try:
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        
-        fake_patterns = [
-            'example.com', 'domain.com', 'test.com', 'sample.com', 
-            'yoursite.com', 'yourdomain.com', 'email.com', 'mail.com', 
-            'image', 'sentry', 'wixpress', 'placeholder', 'dummy', 'fake'
-        ]
+def extract_emails_from_text(text, max_emails=3):
+    """Extract up to max_emails unique, non-placeholder email addresses from text"""
+    seen = set()
+    valid_emails = []
+    for email in EMAIL_RE.findall(text):
+        email_lower = email.lower()
+        if len(email) >= 100 or email_lower in seen or FAKE_RE.search(email_lower):
+            continue
+        seen.add(email_lower)
+        valid_emails.append(email)
+        if len(valid_emails) >= max_emails:
+            break
+    
+    return valid_emails
+
+def extract_social_media_links(links, base_url):
+    """Extract social media profile links from (href, text) pairs"""
+    found_social = {}
+    
+    for href, _ in links:
+        match = SOCIAL_RE.search(href)
+        if not match:
+            continue
         
-        valid_emails = []
-        for email in emails:
-            email_lower = email.lower()
-            if not any(fake in email_lower for fake in fake_patterns):
-                if email not in valid_emails and len(email) < 100:
-                    valid_emails.append(email)
+        platform = match.group(1).lower()
+        platform = SOCIAL_PLATFORM_ALIASES.get(platform, platform)
+        if platform in found_social:
+            continue
         
-        return valid_emails
+        # Protocol-relative hrefs (//instagram.com/...) need the page's scheme
+        if href.startswith('/'):
+            href = urljoin(base_url, href)
+        found_social[platform] = href.split('?')[0]
+    
+    return found_social
+
+def extract_mailto_emails(links, max_emails=3):
+    """Extract up to max_emails unique emails from mailto: hrefs"""
+    seen = set()
+    emails = []
+    for href, _ in links:
+        if not MAILTO_RE.match(href):
+            continue
+        email = href.split(':', 1)[1].split('?')[0].strip()
+        if email and email.lower() not in seen and '@' in email:
+            seen.add(email.lower())
+            emails.append(email)
+            if len(emails) >= max_emails:
+                break
+    
+    return emails
+
+def collect_emails(page_text, links, max_emails=3):
+    """mailto: hrefs first (cheap, precise) - full-text regex sweep only if they fall short"""
+    emails = extract_mailto_emails(links, max_emails)
+    if len(emails) >= max_emails:
+        return emails
+    
+    seen = {email.lower() for email in emails}
+    for email in extract_emails_from_text(page_text, max_emails):
+        if email.lower() not in seen:
+            seen.add(email.lower())
+            emails.append(email)
+            if len(emails) >= max_emails:
+                break
+    
+    return emails
+
+def parse_document(html):
+    """
+    Parse HTML into (visible text, [(href, link text)])
+    Uses selectolax (C parser), falls back to BeautifulSoup if it fails
+    """
+    try:
+        tree = HTMLParser(html)
+        tree.strip_tags(NON_CONTENT_TAGS)
+        page_text = tree.text(separator=' ', strip=True)[:MAX_PAGE_TEXT]
+        links = [
+            (a.attributes.get('href') or '', a.text(strip=True))
+            for a in tree.css('a[href]')
+        ]
+        return page_text, links
     except Exception as e:
-        log_error("EMAIL_EXTRACTION", "Failed to extract emails", str(e))
-        return []
-
-def extract_social_media_links(soup, base_url):
-    """Extract social media profile links"""
-    social_platforms = {
-        'facebook': ['facebook.com', 'fb.com'],
-        'instagram': ['instagram.com'],
-        'twitter': ['twitter.com', 'x.com'],
-        'linkedin': ['linkedin.com'],
-        'youtube': ['youtube.com'],
+        logger.warning(f"selectolax parse failed, using BeautifulSoup: {str(e)}")
+    
+    soup = BeautifulSoup(html, 'lxml', parse_only=ONLY_LINKS)
+    for tag in soup(NON_CONTENT_TAGS):
+        tag.decompose()
+    page_text = soup.get_text(' ', strip=True)[:MAX_PAGE_TEXT]
+    links = [(a['href'], a.get_text()) for a in soup.find_all('a', href=True)]
+    return page_text, links
+
+def parse_homepage(html, website_url):
+    """
+    Parse homepage HTML for emails, social media and contact page links
+    Runs on executor threads - extraction failures go in 'warnings' for the script thread to log
+    """
+    parsed = {
+        'emails': [],
+        'social_media': {},
+        'contact_urls': [],
+        'warnings': [],
+        'error': None
     }
     
-    found_social = {}
+    page_text, links = parse_document(html)
     
     try:
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            try:
-                href = link.get('href', '')
-                
-                if href.startswith('/'):
-                    href = urljoin(base_url, href)
-                
-                for platform, domains in social_platforms.items():
-                    if platform not in found_social:
-                        for domain in domains:
-                            if domain in href.lower():
-                                if '?' in href:
-                                    href = href.split('?')[0]
-                                found_social[platform] = href
-                                break
-            except:
-                continue
-        
-        return found_social
+        parsed['emails'] = collect_emails(page_text, links)
+    except Exception as e:
+        parsed['warnings'].append(("EMAIL_EXTRACTION", "Failed to extract emails", str(e)))
+    try:
+        parsed['social_media'] = extract_social_media_links(links, website_url)
+    except Exception as e:
+        parsed['warnings'].append(("SOCIAL_EXTRACTION", "Failed to extract social media", str(e)))
+    
+    # Visible text excludes scripts, so short text alone is not "empty" - anchors may still hold contacts
+    if len(page_text) < 100 and not parsed['emails'] and not parsed['social_media']:
+        parsed['error'] = "Empty content"
+        return parsed
+    
+    # Collect contact page candidates if no email found
+    if not parsed['emails']:
+        for href, text in links:
+            href_lower = href.lower()
+            text_lower = text.lower()
+            
+            if any(word in href_lower or word in text_lower for word in ['contact', 'about']):
+                full_url = urljoin(website_url, href)
+                if full_url not in parsed['contact_urls']:
+                    parsed['contact_urls'].append(full_url)
+                    if len(parsed['contact_urls']) >= 2:
+                        break
+    
+    return parsed
+
+def parse_contact_page(html):
+    """Parse contact page HTML for emails - (emails, warnings), like parse_homepage"""
+    page_text, links = parse_document(html)
+    try:
+        return collect_emails(page_text, links), []
     except Exception as e:
-        log_error("SOCIAL_EXTRACTION", "Failed to extract social media", str(e))
-        return found_social
+        return [], [("EMAIL_EXTRACTION", "Failed to extract contact page emails", str(e))]
+
+# ============================================
+# FETCH & RESULT CACHES
+# ============================================
+
+def normalize_url(url):
+    """Cache key for a website: lowercase scheme/host, no trailing slash"""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlsplit(url)
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        parts.query,
+        ''
+    ))
 
-def scrape_website_for_contact_info(website_url, business_name="Unknown", timeout=8):
-    """Scrape website for email and social media"""
+def get_cached_contact(key):
+    """Parsed contact info for a normalized URL, or None"""
+    with _contact_cache_lock:
+        cached = _contact_cache.get(key)
+        if cached is not None:
+            _contact_cache.move_to_end(key)
+        return cached
+
+def cache_contact(key, result):
+    """Remember parsed contact info unless the fetch failed transiently"""
+    if result['error'] and result['error'] != "No contact info found":
+        return
+    with _contact_cache_lock:
+        _contact_cache[key] = result
+        _contact_cache.move_to_end(key)
+        while len(_contact_cache) > CONTACT_CACHE_SIZE:
+            _contact_cache.popitem(last=False)
+
+# ============================================
+# CONCURRENT WEBSITE SCRAPING (ASYNCIO)
+# ============================================
+
+async def fetch_contact(session, website_url, timeout=8):
+    """Scrape website for email and social media using a shared aiohttp session"""
     result = {
         'emails': [],
         'social_media': {},
+        'warnings': [],
         'error': None
     }
     
@@ -208,231 +518,306 @@ def scrape_website_for_contact_info(website_url, business_name="Unknown", timeou
         result['error'] = "No website URL"
         return result
     
+    cache_key = normalize_url(website_url)
+    cached = get_cached_contact(cache_key)
+    if cached is not None:
+        return cached
+    
+    if not website_url.startswith(('http://', 'https://')):
+        website_url = 'https://' + website_url
+    
+    loop = asyncio.get_running_loop()
+    
     try:
-        if not website_url.startswith(('http://', 'https://')):
-            website_url = 'https://' + website_url
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive',
-        }
-        
-        response = requests.get(
+        async with session.get(
             website_url, 
-            headers=headers, 
-            timeout=timeout, 
+            timeout=aiohttp.ClientTimeout(total=timeout), 
             allow_redirects=True, 
-            verify=False
-        )
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', '')
-        if 'text/html' not in content_type.lower():
-            result['error'] = f"Non-HTML: {content_type}"
-            return result
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        page_text = soup.get_text()
+            ssl=False
+        ) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('content-type', '')
+            if 'text/html' not in content_type.lower():
+                result['error'] = f"Non-HTML: {content_type}"
+                return result
+            
+            html = await _read_capped(response)
+            # Resolve relative links against where redirects actually landed
+            base_url = str(response.url)
         
-        if not page_text or len(page_text) < 100:
-            result['error'] = "Empty content"
+        # HTML parsing is synchronous CPU work - run it off the event loop
+        parsed = await loop.run_in_executor(None, parse_homepage, html, base_url)
+        result['warnings'] = parsed['warnings']
+        if parsed['error']:
+            result['error'] = parsed['error']
             return result
         
-        # Extract emails
-        emails = extract_emails_from_text(page_text)
+        result['emails'] = parsed['emails']
+        result['social_media'] = parsed['social_media']
         
-        # Check mailto links
-        mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
-        for link in mailto_links:
+        # Try contact page if no email found
+        if parsed['contact_urls']:
             try:
-                email = link.get('href', '').replace('mailto:', '').split('?')[0].strip()
-                if email and email not in emails and '@' in email:
-                    emails.append(email)
+                async with session.get(
+                    parsed['contact_urls'][0], 
+                    timeout=aiohttp.ClientTimeout(total=5), 
+                    ssl=False
+                ) as contact_response:
+                    contact_html = await _read_capped(contact_response)
+                result['emails'], contact_warnings = await loop.run_in_executor(
+                    None, parse_contact_page, contact_html
+                )
+                result['warnings'].extend(contact_warnings)
             except:
-                continue
-        
-        result['emails'] = emails[:3]
-        result['social_media'] = extract_social_media_links(soup, website_url)
-        
-        # Try contact page if no email found
-        if not result['emails']:
-            contact_urls = []
-            for link in soup.find_all('a', href=True):
-                try:
-                    href = link.get('href', '').lower()
-                    text = link.get_text().lower()
-                    
-                    if any(word in href or word in text for word in ['contact', 'about']):
-                        full_url = urljoin(website_url, link.get('href'))
-                        if full_url not in contact_urls and len(contact_urls) < 2:
-                            contact_urls.append(full_url)
-                except:
-                    continue
-            
-            if contact_urls:
-                try:
-                    contact_response = requests.get(
-                        contact_urls[0], 
-                        headers=headers, 
-                        timeout=5, 
-                        verify=False
-                    )
-                    contact_soup = BeautifulSoup(contact_response.text, 'html.parser')
-                    contact_emails = extract_emails_from_text(contact_soup.get_text())
-                    
-                    mailto_links = contact_soup.find_all('a', href=re.compile(r'^mailto:', re.I))
-                    for link in mailto_links:
-                        try:
-                            email = link.get('href', '').replace('mailto:', '').split('?')[0].strip()
-                            if email and email not in contact_emails:
-                                contact_emails.append(email)
-                        except:
-                            continue
-                    
-                    result['emails'] = contact_emails[:3]
-                except:
-                    pass
+                pass
         
         if not result['emails'] and not result['social_media']:
             result['error'] = "No contact info found"
         
+        cache_contact(cache_key, result)
         return result
         
-    except requests.Timeout:
+    except asyncio.TimeoutError:
         result['error'] = f"Timeout ({timeout}s)"
         return result
-    except requests.ConnectionError:
-        result['error'] = "Connection failed"
+    except aiohttp.ClientResponseError as e:
+        result['error'] = f"HTTP {e.status}"
         return result
-    except requests.HTTPError as e:
-        result['error'] = f"HTTP {e.response.status_code}"
+    except aiohttp.ClientConnectionError:
+        result['error'] = "Connection failed"
         return result
     except Exception as e:
         result['error'] = f"Error: {str(e)[:30]}"
         return result
 
+async def _read_capped(response):
+    """Read an aiohttp response body, stopping at MAX_RESPONSE_BYTES"""
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+        body.extend(chunk)
+        if len(body) >= MAX_RESPONSE_BYTES:
+            break
+    return bytes(body[:MAX_RESPONSE_BYTES])
+
+async def _bounded(sem, tag, coro):
+    """Run coroutine under semaphore, tagging its result"""
+    async with sem:
+        return tag, await coro
+
+async def _deliver(idx, task, contact_queue):
+    """Await a (possibly shared) site fetch and hand the result back for business idx"""
+    try:
+        _, contact_info = await task
+    except Exception as e:
+        contact_info = {'emails': [], 'social_media': {}, 'error': f"Error: {str(e)[:30]}"}
+    contact_queue.put((idx, contact_info))
+
+async def consume_websites(website_queue, contact_queue, timeout=8, max_concurrency=10):
+    """
+    Fetch contact info for (idx, website) items as Step 1 produces them
+    Stops at a None sentinel; businesses sharing a website (chains) are fetched once
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=20, ssl=False)
+    site_tasks = {}
+    deliveries = []
+    
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        while True:
+            item = await loop.run_in_executor(None, website_queue.get)
+            if item is None:
+                break
+            
+            idx, website = item
+            key = normalize_url(website)
+            if key not in site_tasks:
+                site_tasks[key] = asyncio.create_task(
+                    _bounded(sem, key, fetch_contact(session, website, timeout))
+                )
+            deliveries.append(asyncio.create_task(_deliver(idx, site_tasks[key], contact_queue)))
+        
+        await asyncio.gather(*deliveries, return_exceptions=True)
+
+def _run_website_consumer(website_queue, contact_queue):
+    """Background thread target - owns the event loop for Step 2"""
+    asyncio.run(consume_websites(website_queue, contact_queue))
+
 # ============================================
 # UTILITY FUNCTIONS
 # ============================================
 
-def extract_text_safe(driver, xpath, attribute=None):
-    """Safely extract text from element"""
-    try:
-        element = driver.find_element(By.XPATH, xpath)
-        if attribute:
-            value = element.get_attribute(attribute)
-            return value if value else "N/A"
-        text = element.text
-        return text if text else "N/A"
-    except:
-        return "N/A"
-
-def extract_phone_number(driver, business_name="Unknown"):
-    """Extract phone number"""
-    phone_xpaths = [
+# Collects every detail field in one CDP round-trip; XPath fallbacks mirror the old per-field lookups
+PLACE_DETAILS_JS = """
+return (() => {
+    // Every match of every XPath, in document order (ORDERED_NODE_SNAPSHOT_TYPE)
+    const all = (...xpaths) => xpaths.flatMap(x => {
+        const snapshot = document.evaluate(x, document, null, 7, null);
+        return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+    });
+    // First XPath whose first match yields a non-empty value - falls through like the old lookups
+    const first = (value, ...xpaths) => {
+        for (const x of xpaths) {
+            const node = document.evaluate(x, document, null, 9, null).singleNodeValue;
+            const v = node ? value(node) : null;
+            if (v) return v;
+        }
+        return null;
+    };
+    const text = n => n.innerText;
+    const aria = n => n.getAttribute('aria-label');
+    const phoneNodes = all(
         "//button[contains(@data-item-id, 'phone')]",
         "//button[contains(@aria-label, 'Phone')]",
         "//a[starts-with(@href, 'tel:')]",
         "//div[contains(@class, 'AeaXub')]//button[contains(@class, 'CsEnBe')]"
-    ]
-    
-    for xpath in phone_xpaths:
-        try:
-            elements = driver.find_elements(By.XPATH, xpath)
-            for element in elements:
-                aria_label = element.get_attribute('aria-label')
-                if aria_label:
-                    phone_match = re.search(r'[\+\d][\d\s\-\(\)\.]{7,}', aria_label)
-                    if phone_match:
-                        return phone_match.group().strip()
-                
-                href = element.get_attribute('href')
-                if href and href.startswith('tel:'):
-                    return href.replace('tel:', '').strip()
-                
-                text = element.text
-                if text:
-                    phone_match = re.search(r'[\+\d][\d\s\-\(\)\.]{7,}', text)
-                    if phone_match:
-                        return phone_match.group().strip()
-        except:
-            continue
-    
-    return "N/A"
-
-def extract_address(driver, business_name="Unknown"):
-    """Extract address"""
-    address_xpaths = [
+    );
+    const address = first(
+        n => (aria(n) || text(n)) ? {aria: aria(n), text: text(n)} : null,
         "//button[contains(@data-item-id, 'address')]",
         "//button[contains(@aria-label, 'Address')]",
         "//div[contains(@class, 'Io6YTe')]"
-    ]
-    
-    for xpath in address_xpaths:
-        try:
-            element = driver.find_element(By.XPATH, xpath)
-            aria_label = element.get_attribute('aria-label')
-            if aria_label:
-                if ':' in aria_label:
-                    return aria_label.split(':', 1)[1].strip()
-                return aria_label.strip()
-            
-            text = element.text
-            if text:
-                return text.strip()
-        except:
-            continue
-    
-    return "N/A"
-
-def extract_website(driver, business_name="Unknown"):
-    """Extract website"""
-    website_xpaths = [
+    );
+    const websites = all(
         "//a[contains(@data-item-id, 'authority')]",
         "//a[contains(@aria-label, 'Website')]",
         "//a[contains(@class, 'CsEnBe') and contains(@href, 'http')]"
-    ]
+    );
+    return {
+        name: first(
+            text,
+            "//h1[contains(@class, 'DUwDvf')]",
+            "//h1[@class='fontHeadlineLarge']",
+            "//div[@role='main']//h1"
+        ),
+        phone_candidates: phoneNodes.flatMap(n => {
+            const href = n.getAttribute('href');
+            return [aria(n), href && href.startsWith('tel:') ? href : null, text(n)];
+        }).filter(v => v),
+        address_aria: address ? address.aria : null,
+        address_text: address ? address.text : null,
+        websites: websites.map(n => n.href).filter(v => v),
+        category: first(
+            text,
+            "//button[contains(@class, 'DkEaL')]",
+            "//button[@jsaction='pane.rating.category']"
+        ),
+        rating: first(text, "//div[contains(@class, 'F7nice')]//span[@aria-hidden='true']"),
+        reviews_aria: first(aria, "//div[contains(@class, 'F7nice')]//span[@aria-label]")
+    };
+})();
+"""
+
+def parse_phone_number(candidates):
+    """Pick phone number from harvested aria-label / href / text candidates"""
+    for value in candidates:
+        if value.startswith('tel:'):
+            return value.replace('tel:', '').strip()
+        phone_match = PHONE_RE.search(value)
+        if phone_match:
+            return phone_match.group().strip()
     
-    for xpath in website_xpaths:
-        try:
-            element = driver.find_element(By.XPATH, xpath)
-            href = element.get_attribute('href')
-            if href and 'google.com' not in href:
-                return href
-        except:
-            continue
+    return "N/A"
+
+def parse_address(aria_label, text):
+    """Clean harvested address aria-label / text"""
+    if aria_label:
+        if ':' in aria_label:
+            return aria_label.split(':', 1)[1].strip()
+        return aria_label.strip()
+    
+    if text:
+        return text.strip()
     
     return "N/A"
 
-def scroll_results_panel(driver, panel, max_scrolls=8):
-    """Scroll to load all results"""
-    scroll_count = 0
-    last_height = driver.execute_script("return arguments[0].scrollHeight", panel)
-    no_change_count = 0
+def parse_website(hrefs):
+    """Pick first harvested non-Google website link"""
+    for href in hrefs:
+        if 'google.com' not in href:
+            return href
     
-    while scroll_count < max_scrolls:
-        try:
-            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", panel)
-            time.sleep(random.uniform(1.5, 2.5))
-            
-            new_height = driver.execute_script("return arguments[0].scrollHeight", panel)
-            
-            if new_height == last_height:
-                no_change_count += 1
-                if no_change_count >= 3:
-                    break
-            else:
-                no_change_count = 0
-                last_height = new_height
-            
-            scroll_count += 1
-        except Exception as e:
-            log_error("SCROLL_ERROR", "Failed to scroll", str(e))
-            break
+    return "N/A"
+
+# Scrolls the feed in-page until no new nodes arrive for idle_ms (MutationObserver) or max_scrolls is hit
+SCROLL_PANEL_JS = """
+const panel = arguments[0], maxScrolls = arguments[1], idleMs = arguments[2];
+const done = arguments[arguments.length - 1];
+let last = Date.now();
+const obs = new MutationObserver(() => { last = Date.now(); });
+obs.observe(panel, {childList: true, subtree: true});
+(function step(i) {
+    if (i >= maxScrolls || (i > 0 && Date.now() - last > idleMs)) {
+        obs.disconnect();
+        return done(i);
+    }
+    panel.scrollTop = panel.scrollHeight;
+    setTimeout(() => step(i + 1), 600);
+})(0);
+"""
+
+def scroll_results_panel(driver, panel, max_scrolls=8, idle_ms=800):
+    """Scroll to load all results - stops as soon as Maps stops appending results"""
+    try:
+        driver.set_script_timeout(30)
+        return driver.execute_async_script(SCROLL_PANEL_JS, panel, max_scrolls, idle_ms) or 0
+    except Exception as e:
+        log_error("SCROLL_ERROR", "Failed to scroll", str(e))
+        return 0
+
+# ============================================
+# PARALLEL DETAIL EXTRACTION
+# ============================================
+
+def extract_business_details(driver, href, keyword):
+    """Open a Google Maps place page and extract its details (None if no name)"""
+    driver.get(href)
+    
+    # Harvest as soon as the details panel h1 renders (raises TimeoutException if it never does)
+    WebDriverWait(driver, 6).until(
+        EC.presence_of_element_located((
+            By.XPATH,
+            "//h1[contains(@class, 'DUwDvf') or @class='fontHeadlineLarge'] | //div[@role='main']//h1"
+        ))
+    )
     
-    return scroll_count
+    data = driver.execute_script(PLACE_DETAILS_JS) or {}
+    
+    name = data.get('name') or "N/A"
+    if name == "N/A":
+        return None
+    
+    reviews = data.get('reviews_aria') or "N/A"
+    if reviews != "N/A" and "reviews" in reviews:
+        reviews = reviews.split()[0].replace(',', '')
+    
+    return {
+        'Business Name': name,
+        'Email ID': 'N/A',
+        'Phone Number': parse_phone_number(data.get('phone_candidates') or []),
+        'Location / Address': parse_address(data.get('address_aria'), data.get('address_text')),
+        'Business Category': data.get('category') or keyword,
+        'Website URL': parse_website(data.get('websites') or []),
+        'Social Media Profiles': 'N/A',
+        'Rating': data.get('rating') or "N/A",
+        'Reviews': reviews
+    }
+
+def _extract_in_worker(href, keyword, worker_state, worker_drivers, driver_pool):
+    """
+    Thread pool task - keeps one Chrome driver per worker thread for the whole batch
+    Runs outside the Streamlit script thread, so errors are raised, not logged
+    """
+    driver = getattr(worker_state, 'driver', None)
+    if driver is None:
+        driver = acquire_driver(driver_pool)
+        if driver is None:
+            raise WebDriverException("Failed to initialize worker Chrome driver")
+        worker_state.driver = driver
+        worker_drivers.append(driver)
+    
+    return extract_business_details(driver, href, keyword)
 
 # ============================================
 # MAIN SCRAPING FUNCTION
@@ -441,10 +826,15 @@ def scroll_results_panel(driver, panel, max_scrolls=8):
 def scrape_google_maps_real(keyword, location, max_results=10, extract_contact=True, progress_callback=None):
     """
     Production-ready Google Maps scraper
-    Creates fresh driver instance to prevent session errors
+    Reuses the Chrome driver parked in session state across runs (dead sessions are rebuilt)
     """
     businesses = []
     driver = None  # Initialize as None
+    driver_pool = queue.Queue()
+    for parked_driver in st.session_state.drivers:
+        driver_pool.put(parked_driver)
+    st.session_state.drivers = []
+    worker_drivers = []
     stats = {
         'total_found': 0,
         'successfully_extracted': 0,
@@ -458,11 +848,10 @@ def scrape_google_maps_real(keyword, location, max_results=10, extract_contact=T
     st.session_state.error_log = []
     
     try:
-        # Get FRESH driver instance
         if progress_callback:
             progress_callback("🔧 Initializing Chrome browser...")
         
-        driver = get_chrome_driver()
+        driver = acquire_driver(driver_pool)
         
         if driver is None:
             error_msg = "❌ Failed to initialize Chrome driver.\n\nCheck deployment configuration."
@@ -547,13 +936,13 @@ def scrape_google_maps_real(keyword, location, max_results=10, extract_contact=T
             log_error("NO_RESULTS", "No business elements", f"Query: {keyword} in {location}")
             return pd.DataFrame(), error_msg, stats
         
-        # Extract business links
+        # Extract business links (plain hrefs, so the search driver can be released)
         business_links = []
         for elem in business_elements:
             try:
                 href = elem.get_attribute('href')
                 if href and 'maps/place' in href:
-                    business_links.append(elem)
+                    business_links.append(href)
                     if len(business_links) >= max_results:
                         break
             except StaleElementReferenceException:
@@ -571,119 +960,121 @@ def scrape_google_maps_real(keyword, location, max_results=10, extract_contact=T
         if progress_callback:
             progress_callback(f"📊 Step 1/2: Found {len(business_links)} businesses. Extracting details...")
         
-        # Extract details for each business
-        for idx, link in enumerate(business_links):
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-                time.sleep(0.6)
-                
-                driver.execute_script("arguments[0].click();", link)
-                time.sleep(random.uniform(2.5, 4))
-                
-                # Extract name
-                name_xpaths = [
-                    "//h1[contains(@class, 'DUwDvf')]",
-                    "//h1[@class='fontHeadlineLarge']",
-                    "//div[@role='main']//h1"
-                ]
-                name = "N/A"
-                for xpath in name_xpaths:
-                    name = extract_text_safe(driver, xpath)
-                    if name != "N/A":
-                        break
-                
-                if name == "N/A":
-                    log_error("NAME_EXTRACT", f"Business #{idx+1}: No name", "All XPaths failed")
-                    stats['google_maps_errors'] += 1
-                    continue
-                
-                phone = extract_phone_number(driver, name)
-                address = extract_address(driver, name)
-                website = extract_website(driver, name)
-                
-                # Extract category
-                category = keyword
-                category_xpaths = [
-                    "//button[contains(@class, 'DkEaL')]",
-                    "//button[@jsaction='pane.rating.category']"
-                ]
-                for xpath in category_xpaths:
-                    cat = extract_text_safe(driver, xpath)
-                    if cat != "N/A":
-                        category = cat
-                        break
-                
-                rating = extract_text_safe(driver, "//div[contains(@class, 'F7nice')]//span[@aria-hidden='true']")
-                
-                reviews = extract_text_safe(driver, "//div[contains(@class, 'F7nice')]//span[@aria-label]", "aria-label")
-                if reviews != "N/A" and "reviews" in reviews:
-                    reviews = reviews.split()[0].replace(',', '')
-                
-                business = {
-                    'Business Name': name,
-                    'Email ID': 'N/A',
-                    'Phone Number': phone,
-                    'Location / Address': address,
-                    'Business Category': category,
-                    'Website URL': website,
-                    'Social Media Profiles': 'N/A',
-                    'Rating': rating,
-                    'Reviews': reviews
+        # Hand the search driver to the worker pool - workers open each place URL directly
+        driver_pool.put(driver)
+        driver = None
+        
+        # Step 2 consumer starts now so website fetches overlap Step 1 extraction
+        website_queue = queue.Queue()
+        contact_queue = queue.Queue()
+        websites_queued = 0
+        consumer = None
+        if extract_contact:
+            consumer = threading.Thread(
+                target=_run_website_consumer,
+                args=(website_queue, contact_queue),
+                daemon=True
+            )
+            consumer.start()
+        
+        # Extract details for each business in parallel
+        results = [None] * len(business_links)
+        worker_state = threading.local()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(DETAIL_WORKERS, len(business_links))) as executor:
+                futures = {
+                    executor.submit(_extract_in_worker, href, keyword, worker_state, worker_drivers, driver_pool): idx
+                    for idx, href in enumerate(business_links)
                 }
                 
-                businesses.append(business)
-                stats['successfully_extracted'] += 1
-                
-                if progress_callback:
-                    progress_callback(f"✓ Step 1/2: Extracted {idx + 1}/{len(business_links)}: {name}")
-                
-            except StaleElementReferenceException:
-                log_error("STALE_ELEMENT", f"Business #{idx+1}: Stale element", "Skip")
-                stats['google_maps_errors'] += 1
-                continue
-            except Exception as e:
-                log_error("EXTRACT_ERROR", f"Business #{idx+1}: Error", str(e))
-                stats['google_maps_errors'] += 1
-                continue
+                for done, future in enumerate(as_completed(futures), start=1):
+                    idx = futures[future]
+                    try:
+                        business = future.result()
+                    except TimeoutException:
+                        log_error("CLICK_TIMEOUT", f"Business #{idx+1}: Details panel did not load", "Skip")
+                        stats['google_maps_errors'] += 1
+                        continue
+                    except StaleElementReferenceException:
+                        log_error("STALE_ELEMENT", f"Business #{idx+1}: Stale element", "Skip")
+                        stats['google_maps_errors'] += 1
+                        continue
+                    except Exception as e:
+                        log_error("EXTRACT_ERROR", f"Business #{idx+1}: Error", str(e))
+                        stats['google_maps_errors'] += 1
+                        continue
+                    
+                    if business is None:
+                        log_error("NAME_EXTRACT", f"Business #{idx+1}: No name", "All XPaths failed")
+                        stats['google_maps_errors'] += 1
+                        continue
+                    
+                    results[idx] = business
+                    stats['successfully_extracted'] += 1
+                    
+                    if consumer and business['Website URL'] != 'N/A':
+                        website_queue.put((idx, business['Website URL']))
+                        websites_queued += 1
+                    
+                    if progress_callback:
+                        progress_callback(f"✓ Step 1/2: Extracted {done}/{len(business_links)}: {business['Business Name']}")
+        finally:
+            # Sentinel - consumer finishes in-flight fetches then exits
+            website_queue.put(None)
+        
+        businesses = [business for business in results if business is not None]
         
         if not businesses:
             error_msg = f"❌ Extracted 0 of {len(business_links)} businesses. See error log."
             return pd.DataFrame(), error_msg, stats
         
-        # Step 2: Extract emails and social media
-        if extract_contact and businesses:
+        # Step 2: Collect emails and social media from the background consumer
+        if consumer:
             if progress_callback:
                 progress_callback(f"🌐 Step 2/2: Scraping websites for {len(businesses)} businesses...")
             
-            for idx, business in enumerate(businesses):
-                website = business.get('Website URL', 'N/A')
-                name = business.get('Business Name', 'Unknown')
+            skipped = len(businesses) - websites_queued
+            if skipped and progress_callback:
+                progress_callback(f"⊗ Step 2/2: Skipping {skipped} businesses with no website")
+            
+            contact_results = {}
+            while len(contact_results) < websites_queued:
+                try:
+                    idx, contact_info = contact_queue.get(timeout=0.5)
+                except queue.Empty:
+                    if not consumer.is_alive() and contact_queue.empty():
+                        log_error("WEBSITE_SCRAPE", "Website consumer stopped early",
+                                  f"{len(contact_results)}/{websites_queued} sites")
+                        break
+                    continue
                 
-                if website != 'N/A':
-                    if progress_callback:
-                        progress_callback(f"🔍 Step 2/2: Scraping {idx + 1}/{len(businesses)}: {name[:30]}")
-                    
-                    contact_info = scrape_website_for_contact_info(website, name)
-                    stats['website_scraped'] += 1
-                    
-                    if contact_info['emails']:
-                        business['Email ID'] = ', '.join(contact_info['emails'])
-                        stats['emails_found'] += 1
-                    else:
-                        if contact_info['error']:
-                            stats['website_errors'] += 1
-                    
-                    if contact_info['social_media']:
-                        social_links = []
-                        for platform, url in contact_info['social_media'].items():
-                            social_links.append(f"{platform.capitalize()}: {url}")
-                        business['Social Media Profiles'] = ' | '.join(social_links)
-                        stats['social_found'] += 1
-                    
-                    time.sleep(random.uniform(1, 2))
+                contact_results[idx] = contact_info
+                if progress_callback:
+                    name = results[idx].get('Business Name', 'Unknown')
+                    progress_callback(f"🔍 Step 2/2: Scraped {len(contact_results)}/{websites_queued}: {name[:30]}")
+            
+            for idx, contact_info in contact_results.items():
+                business = results[idx]
+                stats['website_scraped'] += 1
+                
+                # Parsers ran off the script thread, so their failures are logged here
+                for error_type, message, details in contact_info.get('warnings', ()):
+                    log_error(error_type, message, details)
+                
+                if contact_info['emails']:
+                    business['Email ID'] = ', '.join(contact_info['emails'])
+                    stats['emails_found'] += 1
                 else:
-                    if progress_callback:
-                        progress_callback(f"⊗ Step 2/2: Skipped {idx + 1}/{len(businesses)}: No website")
+                    if contact_info['error']:
+                        stats['website_errors'] += 1
+                
+                if contact_info['social_media']:
+                    business['Social Media Profiles'] = ' | '.join(
+                        f"{PLATFORM_DISPLAY[platform]}: {url}"
+                        for platform, url in contact_info['social_media'].items()
+                    )
+                    stats['social_found'] += 1
         
         st.session_state.extraction_stats = stats
         
@@ -699,13 +1090,94 @@ def scrape_google_maps_real(keyword, location, max_results=10, extract_contact=T
         return pd.DataFrame(), error_msg, stats
     
     finally:
-        # IMPORTANT: Always quit driver to clean up resources
+        # Park one driver for the next run instead of quitting (see "Reset browser" in sidebar)
+        leftover = list(worker_drivers)
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ Chrome driver closed successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Error closing driver: {str(e)}")
+            leftover.append(driver)
+        while not driver_pool.empty():
+            leftover.append(driver_pool.get_nowait())
+        st.session_state.drivers = park_drivers(leftover)
+
+# ============================================
+# RESULT & EXPORT HELPERS (CACHED ACROSS RERUNS)
+# ============================================
+
+@st.cache_resource(show_spinner=False)
+def _empty_leads_df():
+    """Placeholder table shown before any extraction - cache_resource builds it once per process"""
+    return pd.DataFrame(columns=[
+        'Business Name', 'Email ID', 'Phone Number',
+        'Location / Address', 'Business Category',
+        'Website URL', 'Social Media Profiles'
+    ])
+
+_EMPTY_LEADS_DF = _empty_leads_df()
+
+@st.cache_data(show_spinner=False)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    CSV bytes for download - serialized once per extracted dataset
+    Uses Arrow's C++ CSV writer when pyarrow is available, pandas chunked writer otherwise
+    """
+    buf = io.BytesIO()
+    if pacsv is not None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        buf.write(b'\xef\xbb\xbf')  # UTF-8 BOM so Excel detects the encoding
+        pacsv.write_csv(table, buf)
+    else:
+        df.to_csv(buf, index=False, encoding='utf-8-sig', chunksize=5000)
+    return buf.getvalue()
+
+def _clean_filename_part(text, default):
+    """Lowercase, underscore-joined filename fragment (default if text is empty)"""
+    if not text:
+        return default
+    return _SANITIZE_RE.sub('', text).strip().replace(' ', '_').lower()
+
+def _export_filename(keyword, location):
+    """Timestamped CSV filename - built once per extraction so it stays stable across reruns"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    clean_keyword = _clean_filename_part(keyword, 'leads')
+    clean_location = _clean_filename_part(location, 'location')
+    return f"leads_{clean_keyword}_{clean_location}_{timestamp}.csv"
+
+@st.cache_resource(show_spinner=False)
+def _get_na_mask_store():
+    """id(df) -> (weakref to df, masks) plus its lock - cache_resource keeps it across reruns"""
+    return {}, threading.Lock()
+
+_na_mask_store, _na_mask_lock = _get_na_mask_store()
+
+def _na_masks(df: pd.DataFrame):
+    """
+    (email, phone, social) non-'N/A' boolean masks, built once per DataFrame object
+    extracted_data is never mutated between scrapes, so masks stay valid for the object's
+    lifetime; the weakref check stops a recycled id() from returning another frame's masks
+    """
+    with _na_mask_lock:
+        entry = _na_mask_store.get(id(df))
+        if entry is not None and entry[0]() is df:
+            return entry[1]
+        
+        # One array for the fixed schema, sliced by column position - no per-column Series
+        cols = {column: i for i, column in enumerate(df.columns)}
+        values = df.to_numpy(copy=False)
+        masks = (
+            values[:, cols['Email ID']] != 'N/A',
+            values[:, cols['Phone Number']] != 'N/A',
+            values[:, cols['Social Media Profiles']] != 'N/A'
+        )
+        
+        # Drop entries for frames that have been garbage collected
+        for key in [key for key, (ref, _) in _na_mask_store.items() if ref() is None]:
+            del _na_mask_store[key]
+        _na_mask_store[id(df)] = (weakref.ref(df), masks)
+        return masks
+
+def _lead_counts(df: pd.DataFrame):
+    """(email, phone, social) counts of non-'N/A' values - no st.cache_data hashing of df per rerun"""
+    email_mask, phone_mask, social_mask = _na_masks(df)
+    return int(email_mask.sum()), int(phone_mask.sum()), int(social_mask.sum())
 
 # ============================================
 # STREAMLIT UI
@@ -716,8 +1188,15 @@ st.markdown("**Production Ready** | Optimized for Streamlit Cloud & Render")
 
 st.info("📊 **2-Step Process:** Extract from Google Maps (30-60s) → Scrape websites for contact info (5-10s per business)")
 
-# Display error log
-display_error_log()
+# Display error log - placeholder so the extraction handler can refill it in place
+error_log_slot = st.empty()
+
+def render_error_log():
+    with error_log_slot.container():
+        if st.session_state.get('error_log'):
+            display_error_log()
+
+render_error_log()
 
 st.divider()
 
@@ -756,6 +1235,9 @@ extract_contact = st.checkbox(
     help="Uncheck for faster Google Maps-only extraction"
 )
 
+# Opt-in - the full-canvas animation delays first paint of the results
+show_celebration = st.sidebar.checkbox("🎉 Celebrate on success", value=False)
+
 if extract_contact:
     st.caption(f"⏱️ Estimated time: {num_results * 8}-{num_results * 12} seconds")
 else:
@@ -783,39 +1265,50 @@ if start_button:
         st.error("❌ Please enter both keyword and location")
     else:
         st.session_state.is_scraping = True
+        error_log_slot.empty()  # Previous run's log is stale once a new scrape starts
         
         progress_container = st.container()
         
         with progress_container:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            # Bar + status share one placeholder so each update is a single re-render
+            progress_slot = st.empty()
+            last_render = {'t': 0.0, 'pct': 0, 'msg': ''}
+            
+            def render_progress(pct, message):
+                with progress_slot.container():
+                    st.progress(pct)
+                    st.text(message)
+                last_render.update(t=time.monotonic(), pct=pct, msg=message)
             
             def update_progress(message):
-                status_text.text(message)
+                pct = last_render['pct']
                 if "Step 1/2" in message:
                     if "Initializing" in message:
-                        progress_bar.progress(5)
+                        pct = 5
                     elif "Loading" in message:
-                        progress_bar.progress(15)
+                        pct = 15
                     elif "Scrolling" in message:
-                        progress_bar.progress(30)
+                        pct = 30
                     elif "Extracting" in message or "Extracted" in message:
-                        progress_bar.progress(50)
+                        pct = 50
                 elif "Step 2/2" in message:
                     if "Starting" in message or "Scraping websites" in message:
-                        progress_bar.progress(55)
+                        pct = 55
                     else:
-                        try:
-                            parts = message.split(":")
-                            if len(parts) > 1:
-                                nums = parts[1].split("/")
-                                if len(nums) == 2:
-                                    current = int(nums[0].strip().split()[-1])
-                                    total = int(nums[1].split()[0])
-                                    progress = 55 + int((current / total) * 40)
-                                    progress_bar.progress(min(progress, 95))
-                        except:
-                            pass
+                        # "current/total" follows the first ':' (skips the "Step 2/2" marker)
+                        match = _PROGRESS_RE.search(message, message.find(":") + 1)
+                        if match and int(match.group(2)):
+                            current, total = int(match.group(1)), int(match.group(2))
+                            pct = min(55 + int((current / total) * 40), 95)
+                
+                # Same-value guard, then 100ms throttle (progress changes always pass through)
+                if pct == last_render['pct'] and message == last_render['msg']:
+                    return
+                if pct == last_render['pct'] and time.monotonic() - last_render['t'] < 0.1:
+                    return
+                render_progress(pct, message)
+            
+            render_progress(0, "")
             
             start_time = time.time()
             df, error, stats = scrape_google_maps_real(
@@ -827,45 +1320,32 @@ if start_button:
             )
             elapsed_time = time.time() - start_time
             
-            progress_bar.progress(100)
-            
             if error:
+                render_progress(100, f"⏱️ Failed after {elapsed_time:.1f} seconds")
                 st.error(error)
-                status_text.text(f"⏱️ Failed after {elapsed_time:.1f} seconds")
                 
                 if stats['total_found'] > 0:
                     st.warning(f"**Partial Results:** Found {stats['total_found']} but extracted {stats['successfully_extracted']}")
                     
             elif df is not None and not df.empty:
                 st.session_state.extracted_data = df
-                status_text.empty()
-                progress_bar.empty()
-                
-                email_count = len(df[df['Email ID'] != 'N/A'])
-                social_count = len(df[df['Social Media Profiles'] != 'N/A'])
+                st.session_state.export_filename = _export_filename(keyword, location)
+                progress_slot.empty()
                 
+                # Lead metrics render once, in the results panel below
                 st.success(f"✅ Successfully extracted **{len(df)} businesses** in {elapsed_time:.1f}s")
                 
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Total", stats['successfully_extracted'])
-                with col2:
-                    st.metric("Emails", email_count, delta=f"{email_count/len(df)*100:.0f}%")
-                with col3:
-                    st.metric("Social", social_count, delta=f"{social_count/len(df)*100:.0f}%")
-                with col4:
-                    st.metric("Errors", stats['google_maps_errors'] + stats['website_errors'])
-                
-                st.balloons()
+                if show_celebration:
+                    st.balloons()
                 
             else:
                 st.warning(f"⚠️ No results for '{keyword}' in '{location}'.\n\nTry broader keywords or different location.")
-                status_text.text(f"⏱️ Completed in {elapsed_time:.1f}s (0 results)")
+                render_progress(100, f"⏱️ Completed in {elapsed_time:.1f}s (0 results)")
         
-        display_error_log()
+        render_error_log()
         
+        # No st.rerun() - results/export below already render from the new session state
         st.session_state.is_scraping = False
-        st.rerun()
 
 st.divider()
 
@@ -874,52 +1354,60 @@ st.divider()
 # ============================================
 st.subheader("📊 Extracted Leads")
 
-if st.session_state.extracted_data is not None:
-    df = st.session_state.extracted_data
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("📍 Total Leads", len(df))
-    with col2:
-        email_count = len(df[df['Email ID'] != 'N/A'])
-        st.metric("📧 With Email", email_count, delta=f"{email_count/len(df)*100:.0f}%")
-    with col3:
-        phone_count = len(df[df['Phone Number'] != 'N/A'])
-        st.metric("📞 With Phone", phone_count, delta=f"{phone_count/len(df)*100:.0f}%")
-    with col4:
-        social_count = len(df[df['Social Media Profiles'] != 'N/A'])
-        st.metric("🌐 With Social", social_count, delta=f"{social_count/len(df)*100:.0f}%")
-    
-    st.write("")
-    st.dataframe(df, use_container_width=True, height=400)
-    
-    if st.session_state.extraction_stats:
-        stats = st.session_state.extraction_stats
-        with st.expander("📈 Extraction Statistics", expanded=False):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**Google Maps:**")
-                st.write(f"- Found: {stats['total_found']}")
-                st.write(f"- Extracted: {stats['successfully_extracted']}")
-                st.write(f"- Errors: {stats['google_maps_errors']}")
-            
-            with col2:
-                st.write("**Website Scraping:**")
-                st.write(f"- Scraped: {stats['website_scraped']}")
-                st.write(f"- Emails: {stats['emails_found']}")
-                st.write(f"- Social: {stats['social_found']}")
-    
-else:
-    st.info("👆 Enter search parameters and click 'Start Extraction'")
-    
-    empty_df = pd.DataFrame(columns=[
-        'Business Name', 'Email ID', 'Phone Number',
-        'Location / Address', 'Business Category',
-        'Website URL', 'Social Media Profiles'
-    ])
-    st.dataframe(empty_df, use_container_width=True, height=200)
+# Fragment - its own widgets (rows selector) rerun only this panel
+@st.fragment
+def _results_panel():
+    if st.session_state.extracted_data is not None:
+        df = st.session_state.extracted_data
+        email_count, phone_count, social_count = _lead_counts(df)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("📍 Total Leads", len(df))
+        with col2:
+            st.metric("📧 With Email", email_count, delta=f"{email_count/len(df)*100:.0f}%")
+        with col3:
+            st.metric("📞 With Phone", phone_count, delta=f"{phone_count/len(df)*100:.0f}%")
+        with col4:
+            st.metric("🌐 With Social", social_count, delta=f"{social_count/len(df)*100:.0f}%")
+        
+        st.write("")
+        
+        # Only ship the visible rows to the browser - export still uses the full df
+        row_options = [n for n in (50, 200, 1000) if n < len(df)] + [len(df)]
+        page_size = st.selectbox(
+            "Rows to display",
+            row_options,
+            index=min(1, len(row_options) - 1),
+            format_func=lambda n: f"All ({n})" if n == len(df) else str(n)
+        )
+        st.dataframe(df.head(page_size), use_container_width=True, height=400)
+        st.caption(f"Showing {min(page_size, len(df))} of {len(df)} leads")
+        
+        if st.session_state.extraction_stats:
+            stats = st.session_state.extraction_stats
+            with st.expander("📈 Extraction Statistics", expanded=False):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.write("**Google Maps:**")
+                    st.write(f"- Found: {stats['total_found']}")
+                    st.write(f"- Extracted: {stats['successfully_extracted']}")
+                    st.write(f"- Errors: {stats['google_maps_errors']}")
+                
+                with col2:
+                    st.write("**Website Scraping:**")
+                    st.write(f"- Scraped: {stats['website_scraped']}")
+                    st.write(f"- Emails: {stats['emails_found']}")
+                    st.write(f"- Social: {stats['social_found']}")
+        
+    else:
+        st.info("👆 Enter search parameters and click 'Start Extraction'")
+        
+        st.dataframe(_EMPTY_LEADS_DF, use_container_width=True, height=200)
+
+_results_panel()
 
 st.divider()
 
@@ -928,50 +1416,51 @@ st.divider()
 # ============================================
 st.subheader("💾 Export Data")
 
-if st.session_state.extracted_data is not None:
-    df = st.session_state.extracted_data
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    clean_keyword = re.sub(r'[^\w\s-]', '', keyword).strip().replace(' ', '_').lower() if keyword else 'leads'
-    clean_location = re.sub(r'[^\w\s-]', '', location).strip().replace(' ', '_').lower() if location else 'location'
-    filename = f"leads_{clean_keyword}_{clean_location}_{timestamp}.csv"
-    
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col2:
-        csv = df.to_csv(index=False, encoding='utf-8-sig')
-        
-        st.download_button(
-            label="📥 Download CSV",
-            data=csv,
-            file_name=filename,
-            mime='text/csv',
-            use_container_width=True,
-            type="primary"
-        )
-    
-    email_count = len(df[df['Email ID'] != 'N/A'])
-    phone_count = len(df[df['Phone Number'] != 'N/A'])
-    st.success(f"✅ Ready: {filename}")
-    st.caption(f"📊 {len(df)} records | 📧 {email_count} emails | 📞 {phone_count} phones")
-    
-else:
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.button("📥 Download CSV", disabled=True, use_container_width=True)
-    st.caption("⚠️ Extract leads first")
+# Fragment - download clicks rerun only this panel; filename is fixed when the extraction completes
+@st.fragment
+def _export_panel(keyword, location):
+    if st.session_state.extracted_data is not None:
+        df = st.session_state.extracted_data
+        
+        if not st.session_state.export_filename:
+            st.session_state.export_filename = _export_filename(keyword, location)
+        filename = st.session_state.export_filename
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        
+        with col2:
+            csv = _df_to_csv_bytes(df)
+            
+            st.download_button(
+                label="📥 Download CSV",
+                data=csv,
+                file_name=filename,
+                mime='text/csv',
+                use_container_width=True,
+                type="primary"
+            )
+        
+        email_count, phone_count, _ = _lead_counts(df)
+        st.success(f"✅ Ready: {filename}")
+        st.caption(f"📊 {len(df)} records | 📧 {email_count} emails | 📞 {phone_count} phones")
+        
+    else:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.button("📥 Download CSV", disabled=True, use_container_width=True)
+        st.caption("⚠️ Extract leads first")
+
+_export_panel(keyword, location)
 
 # Footer
 st.divider()
 st.caption("🚀 Lead Generation System v3.0 - Production Ready")
 st.caption("⚡ Use responsibly | Respect rate limits and Terms of Service")
 
-# Sidebar
-with st.sidebar:
-    st.header("🔧 System Info")
-    
+# Sidebar - collapsed by default (expanders can't nest, so stats JSON uses its own collapse)
+with st.sidebar.expander("🔧 System Info", expanded=False):
     if st.session_state.extraction_stats:
-        st.json(st.session_state.extraction_stats)
+        st.json(st.session_state.extraction_stats, expanded=False)
     
     st.write("**Session:**")
     st.write(f"- Data: {st.session_state.extracted_data is not None}")
@@ -980,6 +1469,11 @@ with st.sidebar:
     
     if st.button("🗑️ Clear All"):
         st.session_state.extracted_data = None
+        st.session_state.export_filename = None
         st.session_state.error_log = []
         st.session_state.extraction_stats = {}
         st.rerun()
+    
+    if st.button("🔄 Reset browser"):
+        reset_drivers()
+        st.rerun()